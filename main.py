@@ -1,136 +1,259 @@
-from abc import ABC, abstractmethod
 import numpy as np
-from math import floor
+from numba import njit
+from concurrent.futures import ProcessPoolExecutor
+import os
 import sys
-import threading
 import time
 
-class Puzzle:
+# flat (row * 9 + col) indices of the cells in each row, column and box
+CELLS_IN_ROW = np.arange(81).reshape(9, 9)
+CELLS_IN_COL = CELLS_IN_ROW.T.copy()
+CELLS_IN_BOX = np.array([[9 * (3 * (box // 3) + i // 3) + 3 * (box % 3) + i % 3
+                          for i in range(9)] for box in range(9)])
+# box index of each cell, by [row, col] and by flat index
+BOX_OF = np.array([[3 * (r // 3) + c // 3 for c in range(9)] for r in range(9)], dtype=np.int8)
+BOX_OF_CELL = BOX_OF.reshape(81)
+
+# display character for each cell value, indexed by value + 1 so that -1 (a dead end) maps to "!"
+DIGIT_CHARS = ("!", "·") + tuple("123456789")
+
+# status codes returned by solve_kernel
+STALLED = 0
+SOLVED = 1
+CONTRADICTION = 2
+
+
+@njit(cache=True)
+def _lowest_digit(mask):
     """
-    Class representing a single Sudoku puzzle
+    Returns the smallest digit whose bit is set in mask
+    """
+    digit = 0
+    while not (mask >> digit) & 1:
+        digit += 1
+    return digit
 
-    :params:
-    input: filepath to a .txt file containing a sudoku puzzle
-          - see readme for more details
+
+@njit(cache=True)
+def _popcount(mask):
     """
-    class Area(ABC):
-        """
-        Abstract class containing shared methods for Row, Column and Box
-        """
-        def __init__(self, array, index):
-            self.__array = array
-            self.__index = index
-            self.__solved_digits = []
-            self.__required_digits = []
-
-            initial_values = self.contents()
-            for digit in range(1, 10):
-                if digit in initial_values:
-                    self.__solved_digits.append(digit)
-                else:
-                    self.__required_digits.append(digit)
-
-        @property
-        def array(self):
-            return self.__array
-
-        @property
-        def index(self):
-            return self.__index
-
-        @property
-        def solved_digits(self):
-            return self.__solved_digits
-
-        @property
-        def required_digits(self):
-            return self.__required_digits
-
-        @abstractmethod
-        def has(self, digit):
-            return digit in self.contents()
-
-        @abstractmethod
-        def contents(self):
-            """
-            Returns the slice of the array represented by this area
-            """
-            return None
-
-    class Column(Area):
-        """
-        Class representing one column of the puzzle
-        """
-        def __init__(self, array, index):
-            super().__init__(array, index)
+    Returns the number of set bits in mask
+    """
+    count = 0
+    while mask:
+        mask &= mask - 1
+        count += 1
+    return count
 
-        def contents(self):
-            """
-            Returns the slice of the array represented by this object
-            """
-            return self.array[:, self.index]
 
-        def has(self, digit):
-            return super().has(digit)
+@njit(cache=True)
+def _place(grid, row_mask, col_mask, box_mask, cell, digit):
+    """
+    Writes a digit to the flat grid and records it in the row, column and box masks
+    """
+    bit = 1 << digit
+    grid[cell] = digit
+    row_mask[cell // 9] |= bit
+    col_mask[cell % 9] |= bit
+    box_mask[BOX_OF_CELL[cell]] |= bit
 
-    class Row(Area):
-        """
-        Class representing one row of the puzzle
-        """
-        def __init__(self, array, index):
-            super().__init__(array, index)
 
-        def contents(self):
-            """
-            Returns the slice of the array represented by this object
-            """
-            return self.array[self.index, :]
+@njit(cache=True)
+def _compact_empty_cells(grid, empty_cells, empty_count):
+    """
+    Drops filled cells from the first empty_count entries of empty_cells, keeping their order
+    returns: number of cells still empty
+    """
+    kept = 0
+    for i in range(empty_count):
+        cell = empty_cells[i]
+        if grid[cell] == 0:
+            empty_cells[kept] = cell
+            kept += 1
+    return kept
 
-        def has(self, digit):
-            return super().has(digit)
 
-    class Box(Area):
-        """
-        Class representing one box in the puzzle
-        """
-        def __init__(self, array, index):
-            super().__init__(array, index)
+@njit(cache=True)
+def _naked_singles(grid, row_mask, col_mask, box_mask, empty_cells, empty_count):
+    """
+    Places every empty cell that has exactly one candidate
+    returns: number of digits placed, or -1 if a cell has no candidates
+    """
+    placed = 0
+    for i in range(empty_count):
+        cell = empty_cells[i]
+        if grid[cell] != 0:
+            continue
+        used = row_mask[cell // 9] | col_mask[cell % 9] | box_mask[BOX_OF_CELL[cell]]
+        candidates = 0x3FE & ~np.int64(used)
+        if candidates == 0:
+            grid[cell] = -1
+            return -1
+        # a single set bit survives clearing the lowest one as zero
+        if candidates & (candidates - 1) == 0:
+            _place(grid, row_mask, col_mask, box_mask, cell, _lowest_digit(candidates))
+            placed += 1
+    return placed
+
+
+@njit(cache=True)
+def _hidden_singles(grid, row_mask, col_mask, box_mask, unit_cells):
+    """
+    For each unit (one row of unit_cells), places digits that are candidates in only one of its cells
+    returns: number of digits placed, or -1 if a cell is the only home for two digits
+    """
+    candidates = np.zeros(9, dtype=np.int64)
+    others = np.zeros(9, dtype=np.int64)
+    placed = 0
+    for unit in range(9):
+        for i in range(9):
+            cell = unit_cells[unit, i]
+            if grid[cell] == 0:
+                used = row_mask[cell // 9] | col_mask[cell % 9] | box_mask[BOX_OF_CELL[cell]]
+                candidates[i] = 0x3FE & ~np.int64(used)
+            else:
+                candidates[i] = 0
+
+        # others[i] is the OR of every candidate mask except cell i's, built from
+        # a prefix pass and a suffix pass
+        running = 0
+        for i in range(9):
+            others[i] = running
+            running |= candidates[i]
+        running = 0
+        for i in range(8, -1, -1):
+            others[i] |= running
+            running |= candidates[i]
+
+        for i in range(9):
+            forced = candidates[i] & ~others[i]
+            if forced == 0:
+                continue
+            if forced & (forced - 1) != 0:
+                return -1
+            _place(grid, row_mask, col_mask, box_mask, unit_cells[unit, i], _lowest_digit(forced))
+            placed += 1
+    return placed
+
+
+@njit(cache=True)
+def _all_hidden_singles(grid, row_mask, col_mask, box_mask):
+    """
+    Runs the hidden singles search once over rows, then columns, then boxes
+    returns: number of digits placed, or -1 on a contradiction
+    """
+    placed = 0
+    for unit_cells in (CELLS_IN_ROW, CELLS_IN_COL, CELLS_IN_BOX):
+        found = _hidden_singles(grid, row_mask, col_mask, box_mask, unit_cells)
+        if found < 0:
+            return -1
+        placed += found
+    return placed
 
-        def contents(self):
-            """
-            Returns the slice of the array represented by this object
-            """
-            # boxes 0-2 are row 0, 3-5 are row 1, 6-8 are row 2
-            box_row = 3 * floor(self.index / 3)
-            # boxes 0, 3, 6 are col 0; and so on
-            box_col = 3 * (self.index % 3)
 
-            return self.array[box_row:box_row+3, box_col:box_col+3]
+@njit(cache=True)
+def solve_kernel(grid, row_mask, col_mask, box_mask, empty_cells, empty_count):
+    """
+    Runs the forced-digit techniques on a flat grid until none of them make progress
+    returns: (status, number of cells still empty)
+    """
+    # every technique runs on every pass; stop once a whole pass places nothing
+    while True:
+        empty_count = _compact_empty_cells(grid, empty_cells, empty_count)
+        naked = _naked_singles(grid, row_mask, col_mask, box_mask, empty_cells, empty_count)
+        if naked < 0:
+            return CONTRADICTION, empty_count
+        hidden = _all_hidden_singles(grid, row_mask, col_mask, box_mask)
+        if hidden < 0:
+            return CONTRADICTION, empty_count
+        if naked + hidden == 0:
+            break
+
+    if empty_count > 0:
+        return STALLED, empty_count
+    return SOLVED, empty_count
+
+
+@njit(cache=True)
+def search_kernel(grid, row_mask, col_mask, box_mask, empty_cells, empty_count):
+    """
+    Backtracking search on a flat grid: propagates, then guesses at the empty cell
+    with the fewest candidates (MRV) and recurses, restoring state when a guess fails
+    returns: True if the grid was solved, False if it has no solution
+    """
+    status, empty_count = solve_kernel(grid, row_mask, col_mask, box_mask, empty_cells, empty_count)
+    if status == SOLVED:
+        return True
+    if status == CONTRADICTION:
+        return False
+
+    best_cell = -1
+    best_count = 10
+    best_candidates = 0
+    for i in range(empty_count):
+        cell = empty_cells[i]
+        used = row_mask[cell // 9] | col_mask[cell % 9] | box_mask[BOX_OF_CELL[cell]]
+        candidates = 0x3FE & ~np.int64(used)
+        count = _popcount(candidates)
+        if count < best_count:
+            best_cell = cell
+            best_count = count
+            best_candidates = candidates
+            # propagation has already placed every single, so two is the floor
+            if count == 2:
+                break
 
-        def has(self, digit):
-            return super().has(digit)
+    saved_grid = grid.copy()
+    saved_rows = row_mask.copy()
+    saved_cols = col_mask.copy()
+    saved_boxes = box_mask.copy()
+    # deeper calls only ever compact this prefix, so it is all that needs restoring
+    saved_empty = empty_cells[:empty_count].copy()
+    for digit in range(1, 10):
+        if not (best_candidates >> digit) & 1:
+            continue
+        _place(grid, row_mask, col_mask, box_mask, best_cell, digit)
+        if search_kernel(grid, row_mask, col_mask, box_mask, empty_cells, empty_count):
+            return True
+        grid[:] = saved_grid
+        row_mask[:] = saved_rows
+        col_mask[:] = saved_cols
+        box_mask[:] = saved_boxes
+        empty_cells[:empty_count] = saved_empty
+    return False
+
+
+def _solve_file(path):
+    """
+    Worker for Puzzle.solve_batch; lives at module level so it can be pickled
+    """
+    puzzle = Puzzle(path)
+    puzzle.solve()
+    return puzzle
+
+
+class Puzzle:
+    """
+    Class representing a single Sudoku puzzle
 
+    :params:
+    input: filepath to a .txt file containing a sudoku puzzle
+          - see readme for more details
+    """
     # Finally got to the Puzzle init
     def __init__(self, input) -> None:
-        self.__array = np.zeros((9,9))
-
-        # read data from file
+        # read data from file; a whitespace separator also matches the newlines
         with open(input, "r", -1, "utf8") as input_file:
-            for row in range(0, 9):
-                row_data = input_file.readline().replace("\n", "")
-                row_data = row_data.split(" ")
-                for col in range(0, 9):
-                    self.__array[row, col] = int(row_data[col])
-
-        # set up rows, columns, and boxes
-        self.__rows = {}
-        self.__cols = {}
-        self.__boxes = {}
-
-        for index in range (0, 9):
-            self.__rows[index] = self.Row(self.__array, index)
-            self.__cols[index] = self.Column(self.__array, index)
-            self.__boxes[index] = self.Box(self.__array, index)
+            self.__array = np.fromstring(input_file.read(), dtype=np.int8, sep=" ").reshape(9, 9)
+
+        # set up row, column, and box bitmasks; bit d is set iff digit d is present
+        bits = np.where(self.__array > 0, 1 << self.__array.astype(np.uint16), 0).astype(np.uint16)
+        self.row_mask = np.bitwise_or.reduce(bits, axis=1)
+        self.col_mask = np.bitwise_or.reduce(bits, axis=0)
+        self.box_mask = np.bitwise_or.reduce(bits.reshape(81)[CELLS_IN_BOX], axis=1)
+        # flat indices of the empty cells; only the first empty_count entries are live
+        self.empty_cells = np.flatnonzero(self.__array == 0)
+        self.empty_count = len(self.empty_cells)
 
     # boilerplate methods
 
@@ -142,23 +265,18 @@ class Puzzle:
         """
         Returns puzzle as a string
         """
-        output_str = "╔═══════╤═══════╤═══════╗\n"
-        for row in range(0, 9):
-            output_str += "║ "
-            for col in range(0,9):
-                value = int(self.array[row, col])
-                if value == 0:
-                    value = "·"
-                elif value == -1:
-                    value = "!"
-                output_str += f"{value} "
+        parts = ["╔═══════╤═══════╤═══════╗\n"]
+        for row, values in enumerate(self.array.tolist()):
+            parts.append("║ ")
+            for col, value in enumerate(values):
+                parts.append(DIGIT_CHARS[value + 1])
+                parts.append(" ")
                 if (col + 1) % 3 == 0:
-                    output_str += "│ " if col != 8 else "║"
-            output_str += "\n"
+                    parts.append("│ " if col != 8 else "║")
+            parts.append("\n")
             if (row+1) % 3 == 0:
-                border = "╚═══════╧═══════╧═══════╝\n" if row == 8 else "╟───────┼───────┼───────╢\n"
-                output_str += border
-        return output_str
+                parts.append("╚═══════╧═══════╧═══════╝\n" if row == 8 else "╟───────┼───────┼───────╢\n")
+        return "".join(parts)
 
     def draw__with_fancy_borders(self):
         """
@@ -168,7 +286,7 @@ class Puzzle:
         for row in range(0, 9):
             output_str += "||"
             for col in range(0,9):
-                value = int(self.array[row, col])
+                value = self.array[row, col]
                 if value == 0:
                     value = " "
                 output_str += f" {value} |"
@@ -183,23 +301,31 @@ class Puzzle:
 
     def get_box(self, row, col):
         """
-        Returns the index of the Box object which contains the given location
+        Returns the index of the box which contains the given location
         """
-        row_index = 3 * floor(row/3)
-        col_index = floor(col/3)
-        return row_index + col_index
+        return BOX_OF[row, col]
+
+    def _kernel_args(self):
+        """
+        Returns the flat grid view and masks in the order the jitted kernels expect
+        """
+        return self.__array.reshape(81), self.row_mask, self.col_mask, self.box_mask
+
+    def _record_placements(self, placed):
+        """
+        Updates bookkeeping after a kernel call; raises if the kernel hit a dead end
+        """
+        if placed < 0:
+            raise RuntimeError("found cell with no valid digits!")
+        self.empty_count = _compact_empty_cells(self.__array.reshape(81), self.empty_cells, self.empty_count)
+        return placed > 0
 
     def digit_allowed_at(self, value, row, col):
         """
         Helper function that determines whether a given value is allowed at the given location
         """
-        # check row and col
-        if self.__rows[row].has(value):
-            return False
-        if self.__cols[col].has(value):
-            return False
         box_index = self.get_box(row, col)
-        return not self.__boxes[box_index].has(value)
+        return not ((self.row_mask[row] | self.col_mask[col] | self.box_mask[box_index]) >> value) & 1
 
     def solution_is_valid(self):
         """
@@ -207,15 +333,11 @@ class Puzzle:
         :params:
         returns: True if solution is correct, False otherwise
         """
-        for index in range(0, 9):
-            for digit in range(1, 10):
-                if not self.__rows[index].has(digit):
-                    return False
-                if not self.__cols[index].has(digit):
-                    return False
-                if not self.__boxes[index].has(digit):
-                    return False
-        return True
+        # every row, column and box must have bits 1-9 set
+        full = 0x3FE
+        return bool((self.row_mask == full).all()
+                    and (self.col_mask == full).all()
+                    and (self.box_mask == full).all())
 
 
     def solve(self):
@@ -224,192 +346,58 @@ class Puzzle:
         """
         try:
             self.find_forced_digits()
+            if self.empty_count > 0:
+                self.search()
             if not self.solution_is_valid():
                 raise RuntimeError("Invalid solution!")
         except RuntimeError:
             print("ERROR: solve terminated with invalid solution")
         return
 
-    def find_forced_digits(self):
+    def search(self):
         """
-        Loops through rows, columns and boxes placing digits that can only go in one location.
+        Backtracking fallback for puzzles that forced digits alone can't finish
         """
-        while True:
-            if self.find_naked_singles():
-                pass
-            elif self.find_forced_digits_in_rows():
-                pass
-            elif self.find_forced_digits_in_columns():
-                pass
-            elif self.find_forced_digits_in_boxes():
-                pass
-            else:
-                break
+        if not search_kernel(*self._kernel_args(), self.empty_cells, self.empty_count):
+            raise RuntimeError("puzzle has no solution!")
+        self.empty_count = 0
 
-    def solve_multithreaded(self):
+    @classmethod
+    def solve_batch(cls, paths):
         """
-        Runs each solve method in a separate thread
+        Solves independent puzzles in parallel, one process per core
+        :params:
+        paths: filepaths of the puzzles to solve
+        returns: list of solved Puzzle objects, in the same order as paths
         """
+        if not paths:
+            return []
 
-        method_dict = {
-            "naked_singles" : True,
-            "forced_rows" : True,
-            "forced_columns" : True,
-            "forced_boxes" : True
-        }
-
-        threads = []
-
-        for technique in ["naked_singles", "forced_rows", "forced_columns", "forced_boxes"]:
-            threads.append(threading.Thread(None, 
-                target=self.run_methods_in_thread, 
-                args=(technique, method_dict)))
+        # solving the first puzzle here compiles the kernels (or loads them from numba's
+        # cache) once, before the pool starts; workers then reuse them instead of each
+        # paying the compile cost
+        first = _solve_file(paths[0])
+        if len(paths) == 1:
+            return [first]
 
-        for thread in threads:
-            thread.start()
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return [first] + list(executor.map(_solve_file, paths[1:]))
 
-        for thread in threads:
-            thread.join()
-
-        # while threading.active_count() > 0:
-        #     pass
-
-
-    def run_methods_in_thread(self, technique, dict):
-        """
-        Solve method intended to be threaded; loops the given solution method
-        until no more progress is made
-        """
-        solution_dict = {
-            "naked_singles" : self.find_naked_singles,
-            "forced_rows" : self.find_forced_digits_in_rows,
-            "forced_columns" : self.find_forced_digits_in_columns,
-            "forced_boxes" : self.find_forced_digits_in_boxes
-        }
-
-        # loop as long as someone somewhere is making progress on the puzzle
-        while True in dict.values():
-            digit_placed = solution_dict[technique]()
-            dict[technique] = digit_placed
-            # once everything returns negative it runs one more time,
-            # just in case another thread was slow bringing the good news 
-            # if not True in dict.values():
-            #     digit_placed = solution_dict[technique]()
-            #     dict[technique] = digit_placed
-
-
-    def find_forced_digits_in_rows(self):
-        """
-        For all rows, find places where digits can only go in one position
-        :params:
-        returns: True if a digit was placed; False otherwise.
-        """
-        digit_found = False
-        for row in range(0, 9):
-            for digit in range (1, 10):
-                # skip if the digit's already present
-                if not self.__rows[row].has(digit):
-                    # begin locating open cells
-                    open_columns = []
-
-                    # this loop iterates over the boxes the row is in
-                    box_row = 3 * floor(row/3)
-                    for box in [0, 1, 2]:
-                        box_index = box + box_row
-
-                        # if the digit isn't in the box, add all empty cells
-                        if not self.__boxes[box_index].has(digit):
-                            for num in range(0, 3):
-                                col_index = num + box*3
-                                if self.array[row, col_index] == 0:
-                                    open_columns.append(col_index)
-
-                    # weed out cells with column conflicts
-                    candidate_cells = []
-                    for column in open_columns:
-                        if not self.__cols[column].has(digit):
-                            candidate_cells.append(column)
-
-                    # if only one cell remains, place the digit
-                    if len(candidate_cells) == 1:
-                        self.array[row, candidate_cells[0]] = digit
-                        digit_found = True
-
-        return digit_found
-
-    def find_forced_digits_in_columns(self):
+    def find_forced_digits(self):
         """
-        For all columns, find places where digits can only go in one position
-        :params:
-        returns: True if a digit was placed; False otherwise.
+        Loops through rows, columns and boxes placing digits that can only go in one location.
         """
-        digit_found = False
-        for col in range(0, 9):
-            for digit in range (1, 10):
-                # skip if the digit's already present
-                if not self.__cols[col].has(digit):
-                    # begin locating open cells
-                    open_rows = []
-
-                    # this loop iterates over the boxes the row is in
-                    box_col = floor(col/3)
-                    for box in [0, 3, 6]:
-                        box_index = box + box_col
-
-                        # if the digit isn't in the box, add all empty cells
-                        if not self.__boxes[box_index].has(digit):
-                            for num in range(0, 3):
-                                row_index = num + box
-                                if self.array[row_index, col] == 0:
-                                    open_rows.append(row_index)
-
-                    # weed out cells with column conflicts
-                    candidate_cells = []
-                    for row in open_rows:
-                        if not self.__rows[row].has(digit):
-                            candidate_cells.append(row)
-
-                    # if only one cell remains, place the digit
-                    if len(candidate_cells) == 1:
-                        self.array[candidate_cells[0], col] = digit
-                        digit_found = True
-
-        return digit_found
-
-    def find_forced_digits_in_boxes(self):
+        status, self.empty_count = solve_kernel(*self._kernel_args(), self.empty_cells, self.empty_count)
+        if status == CONTRADICTION:
+            raise RuntimeError("found cell with no valid digits!")
+
+    def find_hidden_singles(self):
         """
-        For all columns, find places where digits can only go in one position
+        For all rows, columns and boxes, find digits that can only go in one position
         :params:
         returns: True if a digit was placed; False otherwise.
         """
-        digit_found = False
-        # for each box, check for missing digits
-        for box in range(0, 9):
-            for digit in range (1, 10):
-                if not self.__boxes[box].has(digit):
-
-                    # check which of the rows and columns are restricted
-                    open_rows = []
-                    open_cols = []
-                    for index in range (0, 3):
-                        row_index = 3*floor(box/3) + index
-                        if not self.__rows[row_index].has(digit):
-                            open_rows.append(row_index)
-                        col_index = 3 * (box % 3) + index
-                        if not self.__cols[col_index].has(digit):
-                            open_cols.append(col_index)
-
-                    candidate_cells = []
-                    for row in open_rows:
-                        for col in open_cols:
-                            candidate_cells.append((row, col))
-
-                    if len(candidate_cells) == 1:
-                        location = candidate_cells[0]
-                        self.array[location[0], location[1]] = digit
-                        digit_found = True
-
-        return digit_found
+        return self._record_placements(_all_hidden_singles(*self._kernel_args()))
 
     def find_naked_singles(self):
         """
@@ -417,71 +405,31 @@ class Puzzle:
         :params:
         returns: True if digit place, False otherwise
         """
-        digit_found = False
-        # oop over all empty cells in the puzzle
-        for row in range(0, 9):
-            for col in range (0, 9):
-                if self.array[row, col] == 0:
-
-                    # try each digit and store if viable
-                    valid_digits = []
-                    for digit in range(1,10):
-
-                        if self.digit_allowed_at(digit, row, col):
-                            valid_digits.append(digit)
-
-                            # since we're only looking for naked singles,
-                            # stop looping if we find a second viable digit
-                            if len(valid_digits) > 1:
-                                break
-
-                    if len(valid_digits) == 1:
-                        self.array[row, col] = valid_digits[0]
-                        digit_found = True
-                    elif len(valid_digits) == 0:
-                        self.array[row, col] = -1
-                        raise RuntimeError("found cell with no valid digits!")
-
-        return digit_found
+        return self._record_placements(
+            _naked_singles(*self._kernel_args(), self.empty_cells, self.empty_count))
 
 
 if __name__ == "__main__":
 
-    for arg in sys.argv[1:]:
-        def zipper_print(str1, str2):
-            """
-            prints two strings of equal size next to each other to save terminal space
-            """
-            str1 = str1.split("\n")
-            str2 = str2.split("\n")
-
-            output_str = ""
-            for line in str1:
-                other_line = str2.pop(0)
-                output_str += f"{line}     {other_line}\n"
-            return output_str
-
-        test_puzzle = Puzzle(arg)
-        test_puzzle_2 = Puzzle(arg)
-
-        # test without threading
-        start_time = time.time()
-
-        before = str(test_puzzle)
-        test_puzzle.solve()
-        after = str(test_puzzle)
-
-        single_time = f"Solve time without threading: {time.time()  - start_time} seconds"
-
-        start_time = time.time()
+    def zipper_print(str1, str2):
+        """
+        prints two strings of equal size next to each other to save terminal space
+        """
+        str1 = str1.split("\n")
+        str2 = str2.split("\n")
 
-        before_threaded = str(test_puzzle_2)
-        test_puzzle_2.solve_multithreaded()
-        after_threaded = str(test_puzzle_2)
+        output_str = ""
+        for line in str1:
+            other_line = str2.pop(0)
+            output_str += f"{line}     {other_line}\n"
+        return output_str
 
-        threaded_time = f"Solve time with threading: {time.time()  - start_time} seconds"
+    paths = sys.argv[1:]
 
-        print(zipper_print(before_threaded, after_threaded))
-        print(single_time)
-        print(threaded_time)
+    start_time = time.time()
+    solved_puzzles = Puzzle.solve_batch(paths)
+    solve_time = f"Solve time for {len(paths)} puzzle(s): {time.time() - start_time} seconds"
 
+    for path, solved_puzzle in zip(paths, solved_puzzles):
+        print(zipper_print(str(Puzzle(path)), str(solved_puzzle)))
+    print(solve_time)